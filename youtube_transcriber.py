@@ -8,96 +8,190 @@ import os
 import sys
 import time
 import json
+import random
 import logging
+import logging.handlers
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from datetime import datetime
 from pathlib import Path
 import threading
+import queue
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Tuple
 
 try:
-    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api import YouTubeTranscriptApi, RequestBlocked, YouTubeRequestFailed
+    from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
 except ImportError:
     print("Error: youtube-transcript-api not installed. Run: pip install youtube-transcript-api")
     sys.exit(1)
 
 
+# Errors worth retrying: 429s surface as RequestBlocked/IpBlocked, plus
+# 5xx responses (YouTubeRequestFailed, see _is_transient) and network
+# failures. Anything else is treated as final.
+RETRYABLE_ERRORS = (RequestBlocked, YouTubeRequestFailed, RequestsConnectionError, Timeout)
+
+# watch?v=, youtu.be/, /embed/ and /v/ URLs in a single pass
+_VIDEO_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/(?:embed|v)/)([^&\n?#]+)')
+
+# Saved transcripts are named {title}_{video_id}.txt; video IDs are 11 chars
+_TRANSCRIPT_FILE_RE = re.compile(r'_([A-Za-z0-9_-]{11})\.txt$')
+
+# Characters not allowed in filenames, all mapped to '_'
+_FILENAME_TRANSLATION = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace outgoing requests"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate  # tokens per second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class YouTubeTranscriber:
     def __init__(self):
         self.setup_logging()
         self.input_file = "urls.txt"
         self.output_dir = "transcripts"
-        self.failed_file = "failed_urls.txt"
+        self.failed_file = "failed_urls.jsonl"
         self.log_file = "transcriber.log"
         self.delay_between_requests = 2  # seconds
         self.max_retries = 3
-        
-        # Create output directory
-        Path(self.output_dir).mkdir(exist_ok=True)
+        self.concurrency = 4  # simultaneous fetches
+        self.backoff_base = 0.5  # seconds
+        self.backoff_cap = 60  # seconds
+        self.backoff_jitter = 0.5  # seconds
+        self._rate_limiter = None
+        self._failed_fh = None  # open only while a batch is running
+        self._thread_local = threading.local()
+        self._ensured_dirs = set()  # output directories already created
+        self.force = False  # re-download videos that already have a transcript
+        self._done_ids = set()  # video IDs with a saved transcript
         
         self.logger.info("YouTube Transcriber initialized")
 
     def setup_logging(self):
         """Setup logging configuration"""
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        
+        # Buffer file records and write them in bulk; errors flush immediately
+        file_handler = logging.FileHandler('transcriber.log')
+        file_handler.setFormatter(logging.Formatter(log_format))
+        buffered_handler = logging.handlers.MemoryHandler(capacity=1024, target=file_handler)
+        
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler('transcriber.log'),
+                buffered_handler,
                 logging.StreamHandler()
             ]
         )
         self.logger = logging.getLogger(__name__)
 
+    def flush_logs(self):
+        """Write any buffered log records to disk"""
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL"""
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([^&\n?#]+)',
-            r'youtube\.com/v/([^&\n?#]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
 
     def get_video_title(self, video_id: str) -> str:
-        """Get video title using transcript API"""
-        try:
-            # Try to get transcript list to extract title info
-            ytt_api = YouTubeTranscriptApi()
-            transcript_list = ytt_api.list(video_id)
-            # This is a workaround since the API doesn't directly provide title
-            # We'll use the video_id as fallback
-            return f"Video_{video_id}"
-        except Exception as e:
-            self.logger.warning(f"Could not get title for {video_id}: {e}")
-            return f"Video_{video_id}"
+        """Get video title for the output filename"""
+        # The transcript API doesn't provide titles, so use the video_id
+        return f"Video_{video_id}"
 
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem"""
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        return filename[:200]  # Limit length
+        return filename.translate(_FILENAME_TRANSLATION)[:200]  # Limit length
+
+    def scan_done_ids(self) -> set:
+        """Collect video IDs that already have a transcript in the output directory"""
+        if not os.path.isdir(self.output_dir):
+            return set()
+        
+        done_ids = set()
+        for name in os.listdir(self.output_dir):
+            match = _TRANSCRIPT_FILE_RE.search(name)
+            if match:
+                done_ids.add(match.group(1))
+        return done_ids
+
+    def _ensure_dir(self, path: str):
+        """Create a directory once per process, skipping the syscall afterwards"""
+        if path not in self._ensured_dirs:
+            Path(path).mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _get_api(self) -> YouTubeTranscriptApi:
+        """Return this thread's API client, creating it on first use"""
+        # The client wraps a requests.Session, which is not thread-safe, so each
+        # worker keeps its own and reuses its open connections across URLs
+        api = getattr(self._thread_local, 'api', None)
+        if api is None:
+            api = self._thread_local.api = YouTubeTranscriptApi()
+        return api
+
+    def _is_transient(self, error: Exception) -> bool:
+        """Whether a retryable-looking error is worth another attempt"""
+        if isinstance(error, YouTubeRequestFailed):
+            # Raised from inside `except HTTPError`, which __context__ keeps.
+            # Only 5xx responses are transient; 403/404 and friends are final
+            response = getattr(error.__context__, 'response', None)
+            return response is not None and response.status_code >= 500
+        return True
+
+    def _retry_with_backoff(self, fn, *args, **kwargs):
+        """Call fn, retrying transient errors with capped exponential backoff"""
+        max_retries = max(0, self.max_retries)
+        attempt = 0
+        while True:
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            try:
+                return fn(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt >= max_retries or not self._is_transient(e):
+                    raise
+                delay = min(self.backoff_cap, self.backoff_base * (1.5 ** attempt))
+                delay += random.uniform(0, self.backoff_jitter)
+                self.logger.warning("Transient error (%s), retrying in %.1fs (attempt %d/%d)",
+                                    type(e).__name__, delay, attempt + 1, max_retries)
+                time.sleep(delay)
+                attempt += 1
 
     def fetch_transcript(self, video_id: str, languages: List[str] = ['en']) -> Optional[Dict]:
         """Fetch transcript for a video"""
         try:
-            self.logger.info(f"Fetching transcript for video ID: {video_id}")
+            self.logger.info("Fetching transcript for video ID: %s", video_id)
             
-            # Use the new API approach
-            ytt_api = YouTubeTranscriptApi()
-            fetched_transcript = ytt_api.fetch(video_id, languages=languages)
+            fetched_transcript = self._retry_with_backoff(self._get_api().fetch, video_id, languages=languages)
             
             # Get the text from the FetchedTranscript object
-            transcript_text = ""
-            for snippet in fetched_transcript:
-                transcript_text += snippet.text + " "
+            transcript_text = " ".join(snippet.text for snippet in fetched_transcript)
             
             return {
                 'text': transcript_text.strip(),
@@ -106,7 +200,7 @@ class YouTubeTranscriber:
             }
             
         except Exception as e:
-            self.logger.error(f"Failed to fetch transcript for {video_id}: {e}")
+            self.logger.error("Failed to fetch transcript for %s: %s", video_id, e)
             return {
                 'text': None,
                 'raw': None,
@@ -117,11 +211,15 @@ class YouTubeTranscriber:
     def process_single_url(self, url: str, attempt_count: int = 0) -> Tuple[bool, str]:
         """Process a single URL and return success status and message"""
         try:
-            # Extract video ID
-            video_id = self.extract_video_id(url.strip())
+            # Extract video ID (URLs are already stripped by parse_url_lines)
+            video_id = self.extract_video_id(url)
             if not video_id:
                 return False, f"Invalid YouTube URL: {url}"
             
+            if not self.force and video_id in self._done_ids:
+                self.logger.info("Skipping %s: transcript already downloaded", video_id)
+                return True, f"Cached: {video_id}"
+            
             # Get video title
             title = self.get_video_title(video_id)
             safe_title = self.sanitize_filename(title)
@@ -132,96 +230,174 @@ class YouTubeTranscriber:
             if result['success']:
                 # Save transcript
                 filename = f"{safe_title}_{video_id}.txt"
+                self._ensure_dir(self.output_dir)
                 filepath = os.path.join(self.output_dir, filename)
                 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(f"Title: {title}\n")
-                    f.write(f"Video ID: {video_id}\n")
-                    f.write(f"URL: {url}\n")
-                    f.write(f"Downloaded: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("-" * 50 + "\n\n")
-                    f.write(result['text'])
+                header = (
+                    f"Title: {title}\n"
+                    f"Video ID: {video_id}\n"
+                    f"URL: {url}\n"
+                    f"Downloaded: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    + "-" * 50 + "\n\n"
+                )
+                # One encode and one write instead of six text-mode writes. Write to
+                # a per-writer .part file and rename, so an interrupted write never
+                # leaves a truncated transcript that scan_done_ids would treat as done.
+                # Plain open() keeps the default umask-derived file permissions
+                part_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.part"
+                try:
+                    with open(part_path, 'xb', buffering=1 << 20) as f:
+                        f.write((header + result['text']).encode('utf-8'))
+                    os.replace(part_path, filepath)
+                except BaseException:
+                    try:
+                        os.remove(part_path)
+                    except OSError:
+                        pass
+                    raise
                 
-                self.logger.info(f"Successfully saved transcript: {filename}")
+                self._done_ids.add(video_id)
+                self.logger.info("Successfully saved transcript: %s", filename)
                 return True, f"Success: {title}"
             else:
                 return False, f"Failed to fetch transcript: {result.get('error', 'Unknown error')}"
                 
         except Exception as e:
-            self.logger.error(f"Error processing URL {url}: {e}")
+            self.logger.error("Error processing URL %s: %s", url, e)
             return False, f"Error: {str(e)}"
 
-    def load_urls_from_file(self) -> List[str]:
-        """Load URLs from input file"""
+    def parse_url_entry(self, entry: str) -> Tuple[str, int]:
+        """Split a plain URL, failed-URL JSON record or legacy 'URL | attempts | ...' line"""
+        if entry.startswith('{'):
+            try:
+                record = json.loads(entry)
+                return record['url'], int(record.get('attempts', 0))
+            except (ValueError, KeyError, TypeError):
+                return entry, 0
+        
+        if ' | ' not in entry:
+            return entry, 0
+        
+        parts = entry.split(' | ')
+        try:
+            attempt_count = int(parts[1])
+        except ValueError:
+            attempt_count = 0
+        return parts[0], attempt_count
+
+    def parse_url_lines(self, lines) -> List[Tuple[str, int]]:
+        """Parse lines into (url, attempt_count) pairs, skipping blanks, comments and duplicates"""
+        # Keyed on video ID so youtu.be/X and watch?v=X are fetched once; the
+        # first URL is kept as written. Dicts keep first-seen order
+        entries = {}
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                url, attempt_count = self.parse_url_entry(line)
+                entries.setdefault(self.extract_video_id(url) or url, (url, attempt_count))
+        return list(entries.values())
+
+    def load_urls_from_file(self) -> List[Tuple[str, int]]:
+        """Load URLs and their attempt counts from input file"""
         if not os.path.exists(self.input_file):
             return []
         
-        urls = []
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    urls.append(line)
-        return urls
+        # One bulk read and decode instead of line-at-a-time text iteration
+        with open(self.input_file, 'rb') as f:
+            content = f.read().decode('utf-8')
+        return self.parse_url_lines(content.splitlines())
 
     def save_failed_url(self, url: str, attempt_count: int, error_msg: str):
         """Save failed URL to retry file"""
-        with open(self.failed_file, 'a', encoding='utf-8') as f:
-            f.write(f"{url} | {attempt_count + 1} | {error_msg} | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        record = json.dumps({
+            'url': url,
+            'attempts': attempt_count + 1,
+            'error': error_msg,
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }) + "\n"
+        if self._failed_fh:
+            self._failed_fh.write(record)
+        else:
+            with open(self.failed_file, 'a', encoding='utf-8') as f:
+                f.write(record)
 
-    def remove_url_from_file(self, url: str):
-        """Remove successfully processed URL from input file"""
-        if not os.path.exists(self.input_file):
+    def remove_urls_from_file(self, urls: set):
+        """Remove successfully processed URLs from input file in one atomic rewrite"""
+        if not urls or not os.path.exists(self.input_file):
             return
         
         with open(self.input_file, 'r', encoding='utf-8') as f:
             lines = f.readlines()
         
-        with open(self.input_file, 'w', encoding='utf-8') as f:
+        done_ids = {self.extract_video_id(url) for url in urls} - {None}
+        tmp_file = self.input_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             for line in lines:
-                if line.strip() != url.strip():
+                url = self.parse_url_entry(line.strip())[0]
+                # Also drop other URL forms of a saved video, which dedup skipped
+                if url not in urls and self.extract_video_id(url) not in done_ids:
                     f.write(line)
+        os.replace(tmp_file, self.input_file)
 
-    def process_batch(self, urls: List[str], progress_callback=None):
-        """Process a batch of URLs"""
-        total = len(urls)
+    def process_batch(self, items: List[Tuple[str, int]], progress_callback=None):
+        """Process a batch of (url, attempt_count) pairs, self.concurrency at a time"""
+        total = len(items)
         success_count = 0
         failure_count = 0
+        succeeded = set()
         
-        self.logger.info(f"Starting batch processing of {total} URLs")
+        self.logger.info("Starting batch processing of %d URLs", total)
         
-        for i, url in enumerate(urls):
-            if progress_callback:
-                progress_callback(i, total, f"Processing: {url}")
-            
-            # Extract attempt count if present
-            attempt_count = 0
-            if ' | ' in url:
-                parts = url.split(' | ')
-                if len(parts) >= 2:
-                    try:
-                        attempt_count = int(parts[1])
-                    except ValueError:
-                        attempt_count = 0
-                url = parts[0]  # Clean URL
-            
-            # Process URL
-            success, message = self.process_single_url(url, attempt_count)
-            
-            if success:
-                success_count += 1
-                self.remove_url_from_file(url)
-                self.logger.info(f"[SUCCESS] {message}")
-            else:
-                failure_count += 1
-                self.save_failed_url(url, attempt_count, message)
-                self.logger.error(f"[FAILED] {message}")
+        # One directory listing up front instead of a fetch per finished video
+        self._done_ids = set() if self.force else self.scan_done_ids()
+        
+        # Space request starts (retries included) at least delay_between_requests
+        # apart across all workers, instead of sleeping after each URL
+        if self.delay_between_requests > 0:
+            self._rate_limiter = TokenBucket(1 / self.delay_between_requests)
+        else:
+            self._rate_limiter = None
+        
+        # Keep one buffered handle for failures instead of reopening per URL
+        self._failed_fh = open(self.failed_file, 'a', buffering=1 << 16, encoding='utf-8')
+        try:
+            # The transcript API is blocking I/O, so worker threads overlap the
+            # network waits; results are handled here, one at a time
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                futures = {
+                    executor.submit(self.process_single_url, url, attempt_count): (url, attempt_count)
+                    for url, attempt_count in items
+                }
+                try:
+                    for completed, future in enumerate(as_completed(futures), 1):
+                        url, attempt_count = futures[future]
+                        success, message = future.result()
+                        
+                        if success:
+                            success_count += 1
+                            succeeded.add(url)
+                            self.logger.info("[SUCCESS] %s", message)
+                        else:
+                            failure_count += 1
+                            self.save_failed_url(url, attempt_count, message)
+                            self.logger.error("[FAILED] %s", message)
+                        
+                        if progress_callback:
+                            progress_callback(completed, total, f"Processed: {url}")
+                except BaseException:
+                    # Don't let the executor run the rest of the queue on shutdown
+                    for future in futures:
+                        future.cancel()
+                    raise
             
-            # Throttle requests
-            if i < total - 1:  # Don't delay after last item
-                time.sleep(self.delay_between_requests)
+            self.logger.info("Batch processing complete. Success: %d, Failures: %d", success_count, failure_count)
+        finally:
+            self._failed_fh.close()
+            self._failed_fh = None
+            # Rewrite the queue once, even if the batch was interrupted
+            self.remove_urls_from_file(succeeded)
+            self.flush_logs()
         
-        self.logger.info(f"Batch processing complete. Success: {success_count}, Failures: {failure_count}")
         return success_count, failure_count
 
     def run_headless(self):
@@ -233,17 +409,21 @@ class YouTubeTranscriber:
             self.logger.info("No URLs found in input file. Exiting.")
             return
         
-        self.logger.info(f"Found {len(urls)} URLs to process")
+        self.logger.info("Found %d URLs to process", len(urls))
         success_count, failure_count = self.process_batch(urls)
         
-        self.logger.info(f"Headless run complete. Success: {success_count}, Failures: {failure_count}")
+        self.logger.info("Headless run complete. Success: %d, Failures: %d", success_count, failure_count)
 
 
 class YouTubeTranscriberGUI:
+    UI_REFRESH_MS = 100  # how often queued worker updates are applied
+
     def __init__(self):
         self.transcriber = YouTubeTranscriber()
+        self.ui_queue = queue.Queue()  # updates posted by the worker thread
         self.setup_gui()
         self.processing = False
+        self.root.after(self.UI_REFRESH_MS, self.drain_ui_queue)
 
     def setup_gui(self):
         """Setup the GUI interface"""
@@ -292,6 +472,10 @@ class YouTubeTranscriberGUI:
         self.retries_var = tk.StringVar(value=str(self.transcriber.max_retries))
         ttk.Entry(settings_frame, textvariable=self.retries_var, width=10).grid(row=0, column=3, sticky=tk.W, padx=(5, 0))
         
+        ttk.Label(settings_frame, text="Concurrency:").grid(row=0, column=4, sticky=tk.W, padx=(20, 0))
+        self.concurrency_var = tk.StringVar(value=str(self.transcriber.concurrency))
+        ttk.Entry(settings_frame, textvariable=self.concurrency_var, width=10).grid(row=0, column=5, sticky=tk.W, padx=(5, 0))
+        
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=5, column=0, columnspan=3, pady=(10, 0))
@@ -354,24 +538,57 @@ class YouTubeTranscriberGUI:
         self.output_dir_var.set(self.transcriber.output_dir)
         self.delay_var.set(str(self.transcriber.delay_between_requests))
         self.retries_var.set(str(self.transcriber.max_retries))
+        self.concurrency_var.set(str(self.transcriber.concurrency))
         self.progress_var.set("Ready")
         self.progress_bar['value'] = 0
         self.log_text.delete(1.0, tk.END)
 
     def update_progress(self, current: int, total: int, message: str):
-        """Update progress bar and status"""
-        if total > 0:
-            progress = (current / total) * 100
-            self.progress_bar['value'] = progress
-        self.progress_var.set(f"{current}/{total} - {message}")
-        self.root.update_idletasks()
+        """Queue a progress update; safe to call from the worker thread"""
+        self.ui_queue.put(('progress', (current, total, message)))
 
     def log_message(self, message: str):
-        """Add message to log text widget"""
+        """Queue a log line; safe to call from the worker thread"""
         timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self.ui_queue.put(('log', f"[{timestamp}] {message}\n"))
+
+    def finish_processing(self):
+        """Queue the end-of-run UI reset; safe to call from the worker thread"""
+        self.ui_queue.put(('done', None))
+
+    def drain_ui_queue(self):
+        """Apply queued worker updates on the Tk thread in one batch"""
+        log_lines = []
+        progress = None
+        done = False
+        try:
+            while True:
+                kind, payload = self.ui_queue.get_nowait()
+                if kind == 'log':
+                    log_lines.append(payload)
+                elif kind == 'progress':
+                    progress = payload  # only the latest one is shown
+                elif kind == 'done':
+                    done = True
+        except queue.Empty:
+            pass
+        
+        if log_lines:
+            self.log_text.insert(tk.END, "".join(log_lines))
+            self.log_text.see(tk.END)
+        
+        if progress:
+            current, total, message = progress
+            if total > 0:
+                self.progress_bar['value'] = (current / total) * 100
+            self.progress_var.set(f"{current}/{total} - {message}")
+        
+        if done:
+            self.processing = False
+            self.process_btn.config(text="Process URLs", state='normal')
+            self.progress_var.set("Complete")
+        
+        self.root.after(self.UI_REFRESH_MS, self.drain_ui_queue)
 
     def process_urls(self):
         """Process URLs in a separate thread"""
@@ -387,17 +604,15 @@ class YouTubeTranscriberGUI:
         # Update settings
         try:
             self.transcriber.delay_between_requests = float(self.delay_var.get())
-            self.transcriber.max_retries = int(self.retries_var.get())
+            self.transcriber.max_retries = max(0, int(self.retries_var.get()))
+            self.transcriber.concurrency = max(1, int(self.concurrency_var.get()))
             self.transcriber.output_dir = self.output_dir_var.get()
         except ValueError:
             messagebox.showerror("Error", "Invalid settings values")
             return
         
-        # Create output directory
-        Path(self.transcriber.output_dir).mkdir(exist_ok=True)
-        
         # Parse URLs
-        urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
+        urls = self.transcriber.parse_url_lines(urls_text.split('\n'))
         
         if not urls:
             messagebox.showwarning("Warning", "No valid URLs found")
@@ -420,9 +635,7 @@ class YouTubeTranscriberGUI:
             except Exception as e:
                 self.log_message(f"Error during processing: {e}")
             finally:
-                self.processing = False
-                self.process_btn.config(text="Process URLs", state='normal')
-                self.progress_var.set("Complete")
+                self.finish_processing()
         
         threading.Thread(target=process_thread, daemon=False).start()
 
@@ -433,13 +646,17 @@ class YouTubeTranscriberGUI:
 
 def main():
     """Main entry point"""
-    if len(sys.argv) > 1 and sys.argv[1] == '--headless':
+    args = sys.argv[1:]
+    force = '--force' in args  # re-download existing transcripts
+    if '--headless' in args:
         # Run in headless mode
         transcriber = YouTubeTranscriber()
+        transcriber.force = force
         transcriber.run_headless()
     else:
         # Run GUI mode
         app = YouTubeTranscriberGUI()
+        app.transcriber.force = force
         app.run()
 
 